@@ -52,14 +52,26 @@ Run the script and provide a Google Patents URL when prompted:
 
     python scrape_google_patents.py
 
-Output files are saved to:
+Several URLs separated by whitespace may be entered at the prompt; they are
+downloaded concurrently (see `scrape_many`).
 
-    ./patent_dump/<publication_number>.json
+Output files are saved zstd-compressed to:
+
+    ./patent_dump/<publication_number>.json.zst
+
+Use `load_patent` to read one back into a dict.
+
+Downloaded HTML is cached (gzip-compressed) under ./patent_dump/_html/ for
+seven days, so re-running the script on the same URL skips the network.
+After that, a conditional request is sent and the page is only downloaded
+again if the server reports that it changed.
 
 Dependencies
 ------------
 
-    pip install requests beautifulsoup4 lxml
+    pip install requests lxml "httpx[http2]" orjson zstandard
+
+Optionally install `brotli` so pages can be transferred br-compressed.
 
 Notes
 -----
@@ -72,12 +84,110 @@ Notes
 
 
 
-import json
+import asyncio
+import codecs
+import gzip
+import hashlib
 import re
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
 
+import httpx
+import orjson
 import requests
-from bs4 import BeautifulSoup
+import zstandard as zstd
+from lxml import etree
+from lxml import html as lxml_html
+
+
+# Patterns are compiled once at import time; they run once per claim, so
+# skipping the re module's cache lookup on every call adds up across patents.
+_CLAIM_ITER_RE = re.compile(r"(?<!\S)(\d+)\.(?:\s+(?!\d+\.\s)(.*?))?(?=\s+\d+\.\s|$)")
+_SLUG_RE = re.compile(r"[^A-Za-z0-9_-]+")
+_PATENT_ID_RE = re.compile(r"/patent/([^/?#]+)")
+
+# Field lookups are precompiled XPath expressions evaluated directly by
+# libxml2, so no Python wrapper is built for nodes we never look at.
+# String results are returned as plain str rather than lxml "smart strings",
+# which carry extra state tied to the document.
+_HAS_CLASS = 'contains(concat(" ", normalize-space(@class), " "), " {} ")'
+_XP_TITLE = etree.XPath('string(//meta[@name="DC.title"]/@content)', smart_strings=False)
+_XP_DOC_TITLE = etree.XPath("string(//title)", smart_strings=False)
+_XP_PUB_NUM = etree.XPath('string(//meta[@scheme="citation_patent_number"]/@content)', smart_strings=False)
+_XP_DESCRIPTION = etree.XPath('string(//meta[@name="description"]/@content)', smart_strings=False)
+_XP_ABSTRACT = etree.XPath('//*[@itemprop="abstract"]')
+_XP_CLAIM_BLOCKS = etree.XPath('//*[@itemprop="claims"]')
+_XP_CLAIMS_IN = etree.XPath(f".//*[{_HAS_CLASS.format('claim')}]")
+_XP_CLAIMS_NESTED = etree.XPath(f"//*[{_HAS_CLASS.format('claims')}]//*[{_HAS_CLASS.format('claim')}]")
+_XP_CLAIMS_ANY = etree.XPath(f"//*[{_HAS_CLASS.format('claim')}]")
+_XP_CLAIMS_SECTION = etree.XPath('//section[@id="claims"]')
+
+# One parser per thread rather than one per URL, so parser setup is paid
+# once per thread. lxml parsers are not thread-safe, so each thread that
+# calls into this module gets its own (see _html_parser).
+_PARSER_LOCAL = threading.local()
+
+# Raw HTML is cached on disk, keyed by URL, so repeat runs skip the network
+_HTML_CACHE_DIR = Path("patent_dump") / "_html"
+_HTML_CACHE_MAX_AGE = 7 * 24 * 60 * 60  # seconds
+
+# Responses are streamed into the parser and cache in chunks of this size
+_CHUNK_SIZE = 16 * 1024
+
+# Saved records are mostly repetitive claim text; level 3 compresses it
+# several-fold at a speed where disk IO, not encoding, remains the cost
+_ZSTD_COMPRESSOR = zstd.ZstdCompressor(level=3)
+_ZSTD_DECOMPRESSOR = zstd.ZstdDecompressor()
+
+_HEADERS = {
+    # Mimic a normal browser a bit (helps reduce trivial blocks)
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                  "(KHTML, like Gecko) Chrome/120.0 Safari/537.36",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+# One keep-alive session for all requests, so the TLS handshake is paid
+# once per host rather than once per patent. Its default Accept-Encoding
+# already requests compressed pages (patent HTML compresses ~8x), and
+# includes br when the brotli package is installed.
+_SESSION = requests.Session()
+_SESSION.headers.update(_HEADERS)
+
+
+@dataclass(slots=True)
+class PatentRecord:
+    """
+    Structured data extracted from one Google Patents page.
+
+    Slots avoid a per-instance __dict__, and claims are held as compact
+    (claim_number, text) tuples. Both matter when thousands of records are
+    kept in memory during a batch run. The JSON claim objects are only
+    built by `to_dict` when the record is written out.
+    """
+
+    source: str
+    source_url: str
+    publication_number: str
+    title: str
+    abstract: str
+    claims: list[tuple[int, str]]
+    raw_html_bytes: int
+
+    def to_dict(self) -> dict:
+        """Return the record in its JSON layout, expanding each claim into
+        {"claim_number": <int>, "text": <str>}."""
+        return {
+            "source": self.source,
+            "source_url": self.source_url,
+            "publication_number": self.publication_number,
+            "title": self.title,
+            "abstract": self.abstract,
+            "claims": [{"claim_number": num, "text": text} for num, text in self.claims],
+            "raw_html_bytes": self.raw_html_bytes,
+        }
 
 
 def clean_text(s: str) -> str:
@@ -107,8 +217,12 @@ def clean_text(s: str) -> str:
     str
         Cleaned, normalized string suitable for storage or downstream parsing.
     """
-    s = re.sub(r"\s+", " ", s or "").strip()
-    return s
+    if not s:
+        return ""
+
+    # str.split() with no arguments splits on runs of any whitespace and
+    # drops leading/trailing runs in one C-level pass, no regex engine needed
+    return " ".join(s.split())
 
 
 def normalize_abstract(text: str) -> str:
@@ -138,36 +252,366 @@ def normalize_abstract(text: str) -> str:
     # Normalize whitespace and remove extra spacing characters
     text = clean_text(text)
 
-    # Remove leading "Abstract" label (case-insensitive)
-    text = re.sub(r"^\s*Abstract[:\s-]*", "", text, flags=re.IGNORECASE)
+    # Remove leading "Abstract" label (case-insensitive). After clean_text the
+    # only whitespace left is single spaces, so plain string ops suffice.
+    if text[:8].lower() == "abstract":
+        text = text[8:].lstrip(": -")
 
     return text
 
 
-def scrape_google_patents(url: str) -> dict:
+def _html_parser() -> lxml_html.HTMLParser:
+    # Return this thread's reusable parser, creating it on first use. Input
+    # is always UTF-8 (see to_utf8).
+    parser = getattr(_PARSER_LOCAL, "parser", None)
+    if parser is None:
+        parser = _PARSER_LOCAL.parser = lxml_html.HTMLParser(encoding="utf-8")
+    return parser
+
+
+def _node_text(node) -> str:
+    # Equivalent of get_text(" ", strip=True): join every text fragment in the
+    # subtree with spaces, then normalize
+    return clean_text(" ".join(node.itertext()))
+
+
+def _split_claim(c: str):
+    # Split "<number>. <text>" into (number, text) by scanning the leading
+    # digits directly, which is cheaper than a regex match per claim.
+    # Returns None for strings that don't start with a claim number; the
+    # dot must be followed by whitespace so "3.5 mm" or "1.A" aren't claims.
+    i = 0
+    n = len(c)
+    while i < n and c[i].isdecimal():
+        i += 1
+    if i == 0 or i >= n or c[i] != ".":
+        return None
+    if not (i + 1 < n and c[i + 1].isspace()):
+        return None
+    return int(c[:i]), c[i + 1:].strip()
+
+
+def _claim_heads(texts):
+    # Yield (claim_number, text) for each candidate string shaped like
+    # "<number>. <text>"; anything else is skipped
+    for txt in texts:
+        pair = _split_claim(txt)
+        if pair is not None:
+            yield pair
+
+
+def split_claim_text(text: str) -> list:
+    """
+    Split a block of running claim text into (claim_number, text) pairs.
+
+    This is the fallback used when a page has no per-claim nodes and every
+    claim sits in one text block. A single regex walk finds each
+    "<number>. <text>" run. A number token followed directly by another
+    claim number (for example the "claim 1." reference that ends a
+    dependent claim) has no text of its own and is skipped, so it never
+    swallows the claim that follows it.
+
+    Example:
+        >>> split_claim_text("1. A device comprising a widget. "
+        ...                  "2. A system comprising the device of claim 1. "
+        ...                  "3. The system of claim 2, wherein the widget is blue.")
+        [(1, 'A device comprising a widget.'), (2, 'A system comprising the device of claim'), (3, 'The system of claim 2, wherein the widget is blue.')]
+
+    Parameters
+    ----------
+    text : str
+        Whitespace-normalized claim block text.
+
+    Returns
+    -------
+    list of (int, str)
+        Claim number and claim text for each run, in document order and
+        not yet deduplicated.
+    """
+    return [
+        (int(m.group(1)), m.group(2))
+        for m in _CLAIM_ITER_RE.finditer(text)
+        if m.group(2)
+    ]
+
+
+def dedupe_claims(pairs) -> list:
+    """
+    Deduplicate parsed claims by claim number.
+
+    Google Patents pages frequently repeat the same claim in several DOM
+    nodes (nested "claim" containers, dependent-claim wrappers, etc.). Only
+    the first occurrence of each claim number is kept.
+
+    Both claim extraction paths (per-node and split-text fallback) feed
+    their (number, text) pairs through this function, so each candidate is
+    handled in a single pass.
+
+    Parameters
+    ----------
+    pairs : iterable of (int, str)
+        Claim number and claim text, in document order.
+
+    Returns
+    -------
+    list of (int, str)
+        Unique (claim_number, text) pairs, in document order.
+    """
+    # A dict doubles as an insertion-ordered set: setdefault keeps the first
+    # text seen for each number with a single hash lookup per claim
+    claims_by_num: dict[int, str] = {}
+    for num, text in pairs:
+        claims_by_num.setdefault(num, text)
+
+    return list(claims_by_num.items())
+
+
+def to_utf8(content: bytes, charset) -> bytes:
+    """
+    Return HTML bytes encoded as UTF-8, re-encoding only when required.
+
+    The parser reads UTF-8 natively, so the raw response body can be handed
+    over untouched in the common case. This avoids `requests`' `r.text`
+    property, which runs charset detection over the entire document whenever
+    the server does not declare an encoding.
+
+    Parameters
+    ----------
+    content : bytes
+        Raw response body.
+    charset : str or None
+        Charset declared in the HTTP Content-Type header, if any.
+
+    Returns
+    -------
+    bytes
+        UTF-8 encoded HTML.
+    """
+    if not _needs_transcoding(charset):
+        return content
+
+    return content.decode(charset, errors="replace").encode("utf-8")
+
+
+def _needs_transcoding(charset) -> bool:
+    if not charset:
+        return False
+
+    try:
+        return codecs.lookup(charset).name != "utf-8"
+    except LookupError:
+        # Unknown label; let the parser make the best of the raw bytes
+        return False
+
+
+def _utf8_chunks(chunks, charset):
+    # Streaming counterpart of to_utf8: re-encode chunk by chunk with an
+    # incremental decoder so multi-byte characters split across chunk
+    # boundaries are handled correctly
+    if not _needs_transcoding(charset):
+        yield from chunks
+        return
+
+    decoder = codecs.getincrementaldecoder(charset)(errors="replace")
+    for chunk in chunks:
+        yield decoder.decode(chunk).encode("utf-8")
+    yield decoder.decode(b"", final=True).encode("utf-8")
+
+
+def _html_cache_path(url: str) -> Path:
+    return _HTML_CACHE_DIR / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.html.gz"
+
+
+def _is_fresh(cache_path: Path) -> bool:
+    try:
+        return time.time() - cache_path.stat().st_mtime < _HTML_CACHE_MAX_AGE
+    except FileNotFoundError:
+        return False
+
+
+def _read_html_cache(url: str):
+    """Return the cached HTML for `url` if a fresh copy exists, else None."""
+    cache_path = _html_cache_path(url)
+    if _is_fresh(cache_path):
+        return gzip.decompress(cache_path.read_bytes())
+    return None
+
+
+@contextmanager
+def _replacing(path: Path):
+    # Yield a temp path to write into; it only replaces `path` once the block
+    # completes, so an interrupted run never leaves a truncated cache file
+    # behind. On error the temp file is removed and `path` is left untouched.
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        yield tmp_path
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    tmp_path.replace(path)
+
+
+@contextmanager
+def _html_cache_writer(url: str):
+    # Yield a gzip file to write the page HTML into (see _replacing)
+    with _replacing(_html_cache_path(url)) as tmp_path:
+        with gzip.open(tmp_path, "wb", compresslevel=6) as cache_file:
+            yield cache_file
+
+
+def _write_html_cache(url: str, html: bytes) -> None:
+    with _html_cache_writer(url) as cache_file:
+        cache_file.write(html)
+
+
+def _revalidated_cache(url: str) -> Path:
+    # Called on 304 Not Modified: the stale cached copy is still current, so
+    # restart its max age and return its path for reading
+    cache_path = _html_cache_path(url)
+    cache_path.touch()
+    return cache_path
+
+
+def _empty_page_error(url: str) -> ValueError:
+    # An empty body can't be parsed, and must never be cached, or it would be
+    # served as a "fresh" page for the whole max age
+    return ValueError(f"Empty response body for {url}; nothing to parse")
+
+
+def _validators_path(url: str) -> Path:
+    return _HTML_CACHE_DIR / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.meta.json"
+
+
+def _conditional_headers(url: str) -> dict:
+    """
+    Build If-None-Match / If-Modified-Since headers for a stale cache entry.
+
+    Returns an empty dict when there is no cached copy to fall back on, so
+    the request is sent unconditionally.
+    """
+    if not _html_cache_path(url).exists():
+        return {}
+
+    try:
+        validators = orjson.loads(_validators_path(url).read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        # Missing or unreadable sidecar: fall back to an unconditional request,
+        # whose response rewrites it
+        return {}
+
+    headers = {}
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+    return headers
+
+
+def _write_validators(url: str, response_headers) -> None:
+    # Persist the server's cache validators next to the cached HTML so the
+    # next fetch of a stale entry can be a conditional request
+    validators = {
+        "etag": response_headers.get("ETag"),
+        "last_modified": response_headers.get("Last-Modified"),
+    }
+    with _replacing(_validators_path(url)) as tmp_path:
+        tmp_path.write_bytes(orjson.dumps(validators))
+
+
+def iter_html(url: str):
+    """
+    Stream a Google Patents page as UTF-8 chunks, serving it from the
+    on-disk cache when a fresh copy exists.
+
+    A single HTTP round-trip costs far more than parsing the page, so the
+    body of every successful response is stored gzip-compressed under
+    ./patent_dump/_html/<sha1(url)>.html.gz. Cached copies younger than
+    seven days are read back without touching the network.
+
+    Older copies are revalidated rather than re-downloaded: the ETag and
+    Last-Modified headers saved alongside the cached page are sent back as
+    If-None-Match / If-Modified-Since, and a 304 Not Modified reply (which
+    has no body) means the cached copy is reused.
+
+    The response is streamed rather than buffered: each chunk is written to
+    the cache and handed to the caller as soon as it arrives, so parsing can
+    overlap with the rest of the download and the full page is never held
+    in memory twice.
+
+    Parameters
+    ----------
+    url : str
+        Google Patents URL for the patent to retrieve.
+
+    Yields
+    ------
+    bytes
+        Consecutive chunks of the UTF-8 encoded page HTML.
+    """
+    cache_path = _html_cache_path(url)
+    if not _is_fresh(cache_path):
+        conditional = _conditional_headers(url)
+        with _SESSION.get(url, headers=conditional, timeout=30, stream=True) as r:
+            if r.status_code != 304 or not conditional:
+                yield from _stream_response(url, r)
+                return
+
+        cache_path = _revalidated_cache(url)
+
+    with gzip.open(cache_path, "rb") as cache_file:
+        while chunk := cache_file.read(_CHUNK_SIZE):
+            yield chunk
+
+
+def _stream_response(url: str, r: requests.Response):
+    # Yield a streamed response body as UTF-8 chunks while writing it, and
+    # its cache validators, to the on-disk cache
+    r.raise_for_status()
+
+    # Only trust r.encoding when the header actually names a charset;
+    # otherwise requests reports its ISO-8859-1 default for text/* types.
+    charset = r.encoding if "charset=" in r.headers.get("Content-Type", "").lower() else None
+
+    blank = True
+    with _html_cache_writer(url) as cache_file:
+        for chunk in _utf8_chunks(r.iter_content(chunk_size=_CHUNK_SIZE), charset):
+            blank = blank and not chunk.strip()
+            cache_file.write(chunk)
+            yield chunk
+        if blank:
+            # Raised inside the writer so the cache entry is never committed
+            raise _empty_page_error(url)
+    _write_validators(url, r.headers)
+
+
+def scrape_google_patents(url: str) -> PatentRecord:
 
     """
     Retrieve and parse patent data from a Google Patents webpage.
 
     High-Level Workflow
     -------------------
-    1. Download the webpage HTML using an HTTP request.
-    2. Parse the HTML into a structured document object using BeautifulSoup.
-       This converts raw page text into searchable elements (tags, attributes,
-       metadata, etc.).
+    1. Download the webpage HTML using an HTTP request, or reuse a fresh
+       copy from the on-disk cache.
+    2. Parse the HTML into a structured document object using lxml, feeding
+       the parser chunk by chunk as the page streams in. This converts raw
+       page text into searchable elements (tags, attributes, metadata, etc.).
     3. Locate specific patent fields (title, publication number, abstract,
-       claims) by targeting known HTML metadata tags and CSS selectors.
+       claims) by targeting known HTML metadata tags, itemprop attributes,
+       and CSS classes with precompiled XPath expressions.
     4. Clean and normalize extracted text using helper functions.
     5. Parse and deduplicate claims by claim number to remove duplicate DOM
        artifacts commonly present on Google Patents pages.
-    6. Package the extracted data into a structured dictionary for downstream
+    6. Package the extracted data into a `PatentRecord` for downstream
        storage or analysis.
 
     Notes
     -----
-    • BeautifulSoup is an HTML parser, not a downloader. The page is first
+    • lxml is an HTML parser, not a downloader. The page is first
       retrieved using the `requests` library, then parsed into a searchable
-      structure.
+      structure. XPath queries run inside libxml2, so only the nodes we
+      actually read are wrapped as Python objects.
     • Selectors such as meta tags, itemprop attributes, and CSS classes are
       identified by inspecting the webpage structure using browser developer
       tools.
@@ -181,119 +625,249 @@ def scrape_google_patents(url: str) -> dict:
 
     Returns
     -------
-    dict
+    PatentRecord
         Structured patent data including title, publication number, abstract,
         claims, and source metadata.
     """
 
-    headers = {
-        # Mimic a normal browser a bit (helps reduce trivial blocks)
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-                      "(KHTML, like Gecko) Chrome/120.0 Safari/537.36",
-        "Accept-Language": "en-US,en;q=0.9",
-    }
+    # Feed chunks to lxml as they arrive so parsing overlaps the download
+    parser = _html_parser()
+    raw_html_bytes = 0
+    try:
+        for chunk in iter_html(url):
+            parser.feed(chunk)
+            raw_html_bytes += len(chunk)
+    except BaseException:
+        # Discard the partial document so this thread's parser starts clean
+        # on the next page
+        try:
+            parser.close()
+        except etree.LxmlError:
+            pass
+        raise
+
+    return extract_patent(parser.close(), url, raw_html_bytes)
+
+
+def parse_patent_html(html: bytes, url: str) -> PatentRecord:
+    """
+    Parse already-downloaded Google Patents HTML and extract patent fields.
 
-    r = requests.get(url, headers=headers, timeout=30)
-    r.raise_for_status()
+    Parameters
+    ----------
+    html : bytes
+        UTF-8 encoded page HTML.
+    url : str
+        Source URL, recorded in the output for provenance.
+
+    Returns
+    -------
+    PatentRecord
+        Structured patent data, as returned by `extract_patent`.
+    """
+    if not html.strip():
+        raise _empty_page_error(url)
+
+    doc = lxml_html.document_fromstring(html, parser=_html_parser())
+    return extract_patent(doc, url, len(html))
+
+
+def extract_patent(doc, url: str, raw_html_bytes: int) -> PatentRecord:
+    """
+    Extract patent fields from a parsed Google Patents document.
+
+    This is the extraction half of `scrape_google_patents`, kept separate so
+    the streaming single-URL path and the batch (`scrape_many`) path share
+    the same logic regardless of how the page was retrieved and parsed.
+
+    The returned record holds only plain strings and ints, never lxml
+    elements or smart strings, so nothing in it keeps the parsed tree
+    alive. Callers pass the tree straight in and drop it on return, which
+    keeps peak memory to one document at a time in batch runs.
+
+    Parameters
+    ----------
+    doc : lxml.html.HtmlElement
+        Root element of the parsed page.
+    url : str
+        Source URL, recorded in the output for provenance.
+    raw_html_bytes : int
+        Size of the page HTML in bytes.
 
-    soup = BeautifulSoup(r.text, "lxml")
+    Returns
+    -------
+    PatentRecord
+        Structured patent data including title, publication number, abstract,
+        claims, and source metadata.
+    """
 
     # Title (usually solid)
-    title = ""
-    t = soup.find("meta", attrs={"name": "DC.title"})
-    if t and t.get("content"):
-        title = clean_text(t["content"])
-    elif soup.title:
-        title = clean_text(soup.title.get_text())
+    title = clean_text(_XP_TITLE(doc)) or clean_text(_XP_DOC_TITLE(doc))
 
     # Publication number (best-effort)
-    pub_num = ""
-    pub = soup.find("meta", attrs={"scheme": "citation_patent_number"})
-    if pub and pub.get("content"):
-        pub_num = clean_text(pub["content"])
+    pub_num = clean_text(_XP_PUB_NUM(doc))
 
     # Abstract (often in itemprop="abstract" or a section)
-    abstract = ""
-    abs_node = soup.find(attrs={"itemprop": "abstract"})
-    if abs_node:
-        abstract = normalize_abstract(abs_node.get_text(" ", strip=True))
+    abs_nodes = _XP_ABSTRACT(doc)
+    if abs_nodes:
+        abstract = normalize_abstract(_node_text(abs_nodes[0]))
     else:
-        md = soup.find("meta", attrs={"name": "description"})
-        if md and md.get("content"):
-            abstract = normalize_abstract(md["content"])
+        abstract = normalize_abstract(_XP_DESCRIPTION(doc))
 
     # Claims (Google Patents often uses "claim" classes / itemprop, but it varies)
-    claims = []
-    claim_nodes = soup.select("[itemprop='claims'] .claim") or soup.select(".claims .claim") or soup.select(".claim")
-    # Keep it conservative: only grab text that looks like a claim (starts with a number)
-    for node in claim_nodes:
-        txt = clean_text(node.get_text(" ", strip=True))
-        if re.match(r"^\d+\.\s", txt) or re.match(r"^\d+\s", txt):
-            claims.append(txt)
+    # Locate the claims section(s) once and scope the ".claim" lookups to them,
+    # so the common case never walks scripts, navigation, or citation tables.
+    claim_blocks = _XP_CLAIM_BLOCKS(doc)
+    claim_nodes = [node for block in claim_blocks for node in _XP_CLAIMS_IN(block)]
+    if not claim_nodes:
+        claim_nodes = _XP_CLAIMS_NESTED(doc) or _XP_CLAIMS_ANY(doc)
+
+    claims = dedupe_claims(_claim_heads(_node_text(node) for node in claim_nodes))
 
     # If that didn’t work, try grabbing claim text blocks
     if not claims:
-        alt = soup.select("[itemprop='claims']") or soup.select("section#claims") or []
-        for node in alt:
-            txt = clean_text(node.get_text(" ", strip=True))
+        for node in claim_blocks or _XP_CLAIMS_SECTION(doc):
             # crude split heuristic (works sometimes)
-            parts = re.split(r"(?=(?:\s|^)\d+\.\s)", " " + txt)
-            parts = [clean_text(p) for p in parts if re.match(r"^\d+\.\s", clean_text(p))]
-            if parts:
-                claims = parts
+            claims = dedupe_claims(split_claim_text(_node_text(node)))
+            if claims:
                 break
 
-    # ---- Parse and deduplicate claims by claim number ----
-    parsed_claims = []
-    seen_nums = set()
+    return PatentRecord(
+        source="google_patents",
+        source_url=url,
+        publication_number=pub_num,
+        title=title,
+        abstract=abstract,
+        claims=claims,
+        raw_html_bytes=raw_html_bytes,
+    )
 
-    for c in claims:
-        m = re.match(r"^(\d+)\.\s*(.*)", c)
-        if not m:
-            continue
 
-        num = int(m.group(1))
-        text = m.group(2).strip()
+async def scrape_many(urls, max_concurrency: int = 8) -> list:
+    """
+    Retrieve and parse many Google Patents pages concurrently.
 
-        if num not in seen_nums:
-            parsed_claims.append({
-                "claim_number": num,
-                "text": text
-            })
-            seen_nums.add(num)
+    Bulk acquisition is dominated by network latency rather than parsing,
+    so requests are issued concurrently over a shared HTTP/2 connection,
+    with at most `max_concurrency` downloads in flight at once. Pages
+    already present in the on-disk cache are parsed without a request.
 
-    claims = parsed_claims
+    Failures are isolated per URL: a page that cannot be downloaded or
+    parsed yields its exception in place of a record, so one bad URL does
+    not discard the rest of the batch.
 
+    Parameters
+    ----------
+    urls : iterable of str
+        Google Patents URLs to retrieve.
+    max_concurrency : int
+        Maximum number of simultaneous downloads.
 
-    data = {
-        "source": "google_patents",
-        "source_url": url,
-        "publication_number": pub_num,
-        "title": title,
-        "abstract": abstract,
-        "claims": claims,
-        "raw_html_bytes": len(r.content),
-    }
-    return data
+    Returns
+    -------
+    list of PatentRecord or Exception
+        Structured patent data for each URL, in input order, or the
+        exception raised while scraping that URL.
+    """
+    sem = asyncio.Semaphore(max_concurrency)
+
+    async def fetch_one(client: httpx.AsyncClient, url: str) -> bytes:
+        # Returns only the HTML bytes, so the response object (headers,
+        # buffered body) is released before the page is parsed
+        html = _read_html_cache(url)
+        if html is not None:
+            return html
+
+        conditional = _conditional_headers(url)
+        async with sem:
+            r = await client.get(url, headers=conditional, timeout=30)
+
+        if r.status_code == 304 and conditional:
+            return gzip.decompress(_revalidated_cache(url).read_bytes())
+
+        r.raise_for_status()
+        html = to_utf8(r.content, r.charset_encoding)
+        if not html.strip():
+            raise _empty_page_error(url)
+
+        _write_html_cache(url, html)
+        _write_validators(url, r.headers)
+        return html
+
+    async def scrape_one(client: httpx.AsyncClient, url: str) -> PatentRecord:
+        return parse_patent_html(await fetch_one(client, url), url)
+
+    async with httpx.AsyncClient(http2=True, headers=_HEADERS, follow_redirects=True) as client:
+        return await asyncio.gather(
+            *(scrape_one(client, url) for url in urls), return_exceptions=True
+        )
+
+
+def save_patent(record: PatentRecord, out_dir: Path) -> Path:
+    """
+    Write one patent record to `out_dir` as zstd-compressed JSON and return
+    the file path.
+
+    The filename is the publication number, falling back to the patent ID
+    in the source URL so records in a batch run don't overwrite each other.
+    """
+    slug = record.publication_number
+    if not slug:
+        m = _PATENT_ID_RE.search(record.source_url)
+        slug = m.group(1) if m else "patent"
+    slug = _SLUG_RE.sub("_", slug)
+    out_path = out_dir / f"{slug}.json.zst"
+
+    # orjson encodes straight to UTF-8 bytes, skipping the intermediate str
+    data = orjson.dumps(record.to_dict(), option=orjson.OPT_INDENT_2)
+    out_path.write_bytes(_ZSTD_COMPRESSOR.compress(data))
+    return out_path
+
+
+def load_patent(path: Path) -> dict:
+    """
+    Read a saved patent record back into a dict.
+
+    Accepts both zstd-compressed (.json.zst) output and plain .json files
+    written by earlier versions of this script.
+
+    Parameters
+    ----------
+    path : Path
+        Path to a saved patent record.
+
+    Returns
+    -------
+    dict
+        The patent record in its JSON layout.
+    """
+    data = Path(path).read_bytes()
+    if str(path).endswith(".zst"):
+        data = _ZSTD_DECOMPRESSOR.decompress(data)
+    return orjson.loads(data)
 
 
 if __name__ == "__main__":
     # Example: "https://patents.google.com/patent/US1234567A/en"
-    url = input("Google Patents URL: ").strip()
+    # Several URLs separated by whitespace are scraped concurrently.
+    urls = input("Google Patents URL(s): ").split()
 
     out_dir = Path("patent_dump")
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    data = scrape_google_patents(url)
+    if len(urls) == 1:
+        results = [scrape_google_patents(urls[0])]
+    else:
+        results = asyncio.run(scrape_many(urls))
 
-    # Choose a filename
-    slug = data["publication_number"] or "patent"
-    slug = re.sub(r"[^A-Za-z0-9_-]+", "_", slug)
-    out_path = out_dir / f"{slug}.json"
+    for url, record in zip(urls, results):
+        if isinstance(record, Exception):
+            print(f"Failed: {url} ({record})")
+            continue
 
-    out_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
-    print(f"Saved: {out_path}")
-    print(f"Title: {data['title']}")
-    print(f"Abstract chars: {len(data['abstract'])}")
-    print(f"Claims extracted: {len(data['claims'])}")
+        out_path = save_patent(record, out_dir)
+        print(f"Saved: {out_path}")
+        print(f"Title: {record.title}")
+        print(f"Abstract chars: {len(record.abstract)}")
+        print(f"Claims extracted: {len(record.claims)}")
 